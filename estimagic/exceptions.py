@@ -1,10 +1,9 @@
-try:
-    from better_exceptions import format_exception
-except ImportError:
-    from traceback import format_exception
 import sys
 
 
+_format_exception = None
+
+
 class TableExistsError(Exception):
     pass
 
@@ -21,7 +20,24 @@ class StopOptimization(Exception):
 
 
 def get_traceback():
-    tb = format_exception(*sys.exc_info())
+    tb = _get_format_exception()(*sys.exc_info())
     if isinstance(tb, list):
         tb = "".join(tb)
     return tb
+
+
+def _get_format_exception():
+    """Import the traceback formatter on first use and cache it.
+
+    better_exceptions is only imported once a traceback is actually needed so that
+    importing estimagic does not pay for it.
+
+    """
+    global _format_exception
+    if _format_exception is None:
+        try:
+            from better_exceptions import format_exception
+        except ImportError:
+            from traceback import format_exception
+        _format_exception = format_exception
+    return _format_exception
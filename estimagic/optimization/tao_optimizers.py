@@ -10,10 +10,8 @@ from estimagic.optimization.algo_options import CONVERGENCE_SCALED_GRADIENT_TOLE
 from estimagic.optimization.algo_options import STOPPING_MAX_ITERATIONS
 from estimagic.optimization.utilities import calculate_trustregion_initial_radius
 
-try:
+if IS_PETSC4PY_INSTALLED:
     from petsc4py import PETSc
-except ImportError:
-    pass
 
 POUNDERS_ALGO_INFO = {
     "primary_criterion_entry": "root_contributions",
@@ -22,6 +20,21 @@ POUNDERS_ALGO_INFO = {
     "name": "tao_pounders",
 }
 
+_TAO_REASONS = {
+    3: "absolute_gradient_tolerance below critical value",
+    4: "relative_gradient_tolerance below critical value",
+    5: "scaled_gradient_tolerance below critical value",
+    6: "step size small",
+    7: "objective below min value",
+    8: "user defined",
+    -2: "maxits reached",
+    -4: "numerical problems",
+    -5: "max funcevals reached",
+    -6: "line search failure",
+    -7: "trust region failure",
+    -8: "user defined",
+}
+
 
 def tao_pounders(
     criterion_and_derivative,
@@ -128,7 +141,7 @@ def tao_pounders(
             "root_contributions"
         ]
     )
-    residuals_out = _initialise_petsc_array(n_errors)
+    residuals_out = _initialise_petsc_array(n_errors, prototype=x)
 
     # Create the solver object.
     tao = PETSc.TAO().create(PETSc.COMM_WORLD)
@@ -149,7 +162,7 @@ def tao_pounders(
              f: Petsc object in which we save the current function value.
 
         """
-        resid_out.array = func(x.array)
+        np.copyto(resid_out.getArray(), func(x.getArray(readonly=True)))
 
     # Set the procedure for calculating the objective. This part has to be changed if we
     # want more than pounders.
@@ -162,8 +175,8 @@ def tao_pounders(
     tao.setInitialTrustRegionRadius(trustregion_initial_radius)
 
     # Add bounds.
-    lower_bounds = _initialise_petsc_array(lower_bounds)
-    upper_bounds = _initialise_petsc_array(upper_bounds)
+    lower_bounds = _initialise_petsc_array(lower_bounds, prototype=x)
+    upper_bounds = _initialise_petsc_array(upper_bounds, prototype=x)
     tao.setVariableBounds(lower_bounds, upper_bounds)
 
     # Put the starting values into the container and pass them to the optimizer.
@@ -198,27 +211,27 @@ def tao_pounders(
     # Set user defined convergence tests. Beware that specifying multiple tests could
     # overwrite others or lead to unclear behavior.
     if stopping_max_iterations is not None:
-        tao.setConvergenceTest(functools.partial(_max_iters, stopping_max_iterations))
+        tao.setConvergenceTest(lambda tao: _max_iters(stopping_max_iterations, tao))
     elif (
         convergence_scaled_gradient_tolerance is False
         and convergence_absolute_gradient_tolerance is False
     ):
         tao.setConvergenceTest(
-            functools.partial(_grtol_conv, convergence_relative_gradient_tolerance)
+            lambda tao: _grtol_conv(convergence_relative_gradient_tolerance, tao)
         )
     elif (
         convergence_relative_gradient_tolerance is False
         and convergence_scaled_gradient_tolerance is False
     ):
         tao.setConvergenceTest(
-            functools.partial(_gatol_conv, convergence_absolute_gradient_tolerance)
+            lambda tao: _gatol_conv(convergence_absolute_gradient_tolerance, tao)
         )
     elif convergence_scaled_gradient_tolerance is False:
         tao.setConvergenceTest(
-            functools.partial(
-                _grtol_gatol_conv,
+            lambda tao: _grtol_gatol_conv(
                 convergence_relative_gradient_tolerance,
                 convergence_absolute_gradient_tolerance,
+                tao,
             )
         )
 
@@ -234,20 +247,26 @@ def tao_pounders(
     return results
 
 
-def _initialise_petsc_array(len_or_array):
+def _initialise_petsc_array(len_or_array, prototype=None):
     """Initialize an empty array or fill in provided values.
 
     Args:
         len_or_array (int or numpy.ndarray): If the value is an integer, allocate an
             empty array with the given length. If the value is an array, allocate an
             array of equal length and fill in the values.
+        prototype (PETSc.Vec, optional): An already configured vector. If it has the
+            requested length, the new array is duplicated from it which avoids
+            parsing the PETSc options again.
 
     """
     length = len_or_array if isinstance(len_or_array, int) else len(len_or_array)
 
-    array = PETSc.Vec().create(PETSc.COMM_WORLD)
-    array.setSizes(length)
-    array.setFromOptions()
+    if prototype is not None and prototype.getSize() == length:
+        array = prototype.duplicate()
+    else:
+        array = PETSc.Vec().create(PETSc.COMM_WORLD)
+        array.setSizes(length)
+        array.setFromOptions()
 
     if isinstance(len_or_array, np.ndarray):
         array.array = len_or_array
@@ -256,64 +275,43 @@ def _initialise_petsc_array(len_or_array):
 
 
 def _max_iters(max_iterations, tao):
-    if tao.getSolutionStatus()[0] < max_iterations:
+    n_iterations, *_ = tao.getSolutionStatus()
+    if n_iterations < max_iterations:
         return 0
-    elif tao.getSolutionStatus()[0] >= max_iterations:
+    else:
         tao.setConvergedReason(8)
 
 
 def _gatol_conv(absolute_gradient_tolerance, tao):
-    if tao.getSolutionStatus()[2] >= absolute_gradient_tolerance:
+    _, _, gradient_norm, *_ = tao.getSolutionStatus()
+    if gradient_norm >= absolute_gradient_tolerance:
         return 0
-    elif tao.getSolutionStatus()[2] < absolute_gradient_tolerance:
+    else:
         tao.setConvergedReason(3)
 
 
 def _grtol_conv(relative_gradient_tolerance, tao):
-    if (
-        tao.getSolutionStatus()[2] / tao.getSolutionStatus()[1]
-        >= relative_gradient_tolerance
-    ):
+    _, criterion, gradient_norm, *_ = tao.getSolutionStatus()
+    ratio = gradient_norm / (criterion or 1.0)
+    if ratio >= relative_gradient_tolerance:
         return 0
-    elif (
-        tao.getSolutionStatus()[2] / tao.getSolutionStatus()[1]
-        < relative_gradient_tolerance
-    ):
+    else:
         tao.setConvergedReason(4)
 
 
 def _grtol_gatol_conv(relative_gradient_tolerance, absolute_gradient_tolerance, tao):
-    if (
-        tao.getSolutionStatus()[2] / tao.getSolutionStatus()[1]
-        >= relative_gradient_tolerance
-    ):
-        return 0
-    elif (
-        tao.getSolutionStatus()[2] / tao.getSolutionStatus()[1]
-        < relative_gradient_tolerance
-    ):
+    _, criterion, gradient_norm, *_ = tao.getSolutionStatus()
+    ratio = gradient_norm / (criterion or 1.0)
+    if ratio < relative_gradient_tolerance:
         tao.setConvergedReason(4)
-
-    elif tao.getSolutionStatus()[2] < absolute_gradient_tolerance:
+    elif gradient_norm < absolute_gradient_tolerance:
         tao.setConvergedReason(3)
+    else:
+        return 0
 
 
-def _translate_tao_convergence_reason(tao_resaon):
-    mapping = {
-        3: "absolute_gradient_tolerance below critical value",
-        4: "relative_gradient_tolerance below critical value",
-        5: "scaled_gradient_tolerance below critical value",
-        6: "step size small",
-        7: "objective below min value",
-        8: "user defined",
-        -2: "maxits reached",
-        -4: "numerical problems",
-        -5: "max funcevals reached",
-        -6: "line search failure",
-        -7: "trust region failure",
-        -8: "user defined",
-    }
-    return mapping[tao_resaon]
+def _translate_tao_convergence_reason(tao_reason):
+    return _TAO_REASONS.get(tao_reason, "unknown")
 
 
 def _process_pounders_results(residuals_out, tao):
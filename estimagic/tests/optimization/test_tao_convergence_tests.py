@@ -0,0 +1,56 @@
+"""Test the convergence tests of the pounders wrapper without petsc4py."""
+import pytest
+
+from estimagic.optimization.tao_optimizers import _grtol_conv
+from estimagic.optimization.tao_optimizers import _grtol_gatol_conv
+
+
+class _FakeTao:
+    def __init__(self, criterion, gradient_norm):
+        self.solution_status = (10, criterion, gradient_norm, 0.0, 0.5, 0)
+        self.converged_reason = None
+
+    def getSolutionStatus(self):  # noqa: N802
+        return self.solution_status
+
+    def setConvergedReason(self, reason):  # noqa: N802
+        self.converged_reason = reason
+
+
+def test_grtol_conv_with_zero_criterion():
+    tao = _FakeTao(criterion=0.0, gradient_norm=1e-10)
+    assert _grtol_conv(1e-8, tao) is None
+    assert tao.converged_reason == 4
+
+
+@pytest.mark.parametrize(
+    "gradient_norm, expected_return, expected_reason", [(1e-10, None, 4), (1, 0, None)]
+)
+def test_grtol_conv(gradient_norm, expected_return, expected_reason):
+    tao = _FakeTao(criterion=10.0, gradient_norm=gradient_norm)
+    assert _grtol_conv(1e-8, tao) == expected_return
+    assert tao.converged_reason == expected_reason
+
+
+def test_grtol_gatol_conv_with_zero_criterion():
+    tao = _FakeTao(criterion=0.0, gradient_norm=1e-10)
+    assert _grtol_gatol_conv(1e-8, 1e-12, tao) is None
+    assert tao.converged_reason == 4
+
+
+def test_grtol_gatol_conv_relative_tolerance_reached():
+    tao = _FakeTao(criterion=10.0, gradient_norm=1e-10)
+    assert _grtol_gatol_conv(1e-8, 1e-12, tao) is None
+    assert tao.converged_reason == 4
+
+
+def test_grtol_gatol_conv_absolute_tolerance_reached():
+    tao = _FakeTao(criterion=1e-6, gradient_norm=1e-10)
+    assert _grtol_gatol_conv(1e-8, 1e-9, tao) is None
+    assert tao.converged_reason == 3
+
+
+def test_grtol_gatol_conv_not_converged():
+    tao = _FakeTao(criterion=10.0, gradient_norm=1.0)
+    assert _grtol_gatol_conv(1e-8, 1e-9, tao) == 0
+    assert tao.converged_reason is None
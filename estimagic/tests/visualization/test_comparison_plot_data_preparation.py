@@ -1,4 +1,5 @@
 """Tests for the comparison_plot_data_preparation functions."""
+
 from collections import namedtuple
 from pathlib import Path
 
@@ -84,6 +85,37 @@ def test_consolidate_parameter_attribute_uncompatible():
         )
 
 
+# split_by_parameter
+# ===================
+
+
+def test_split_by_parameter():
+    ind = pd.MultiIndex.from_tuples(
+        [("b", 0), ("a", 1), ("b", 0), ("a", 1)], names=["ind1", "ind2"]
+    )
+    all_data = pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0]}, index=ind)
+    param_codes, params = pd.factorize(all_data.index)
+    res = test_module._split_by_parameter(all_data, param_codes, params)
+    assert list(res) == [("b", 0), ("a", 1)]
+    pdt.assert_frame_equal(res[("a", 1)], all_data.iloc[[1, 3]])
+
+
+def test_split_by_parameter_single_row_is_frame():
+    all_data = pd.DataFrame({"value": [1.0, 2.0]}, index=["a", "b"])
+    param_codes, params = pd.factorize(all_data.index)
+    res = test_module._split_by_parameter(all_data, param_codes, params)
+    pdt.assert_frame_equal(res["a"], all_data.iloc[[0]])
+
+
+def test_split_by_parameter_with_order():
+    all_data = pd.DataFrame({"value": [1.0, 2.0, 3.0, 4.0]}, index=["a", "b", "a", "a"])
+    param_codes, params = pd.factorize(all_data.index)
+    order = np.array([3, 1, 0, 2])
+    res = test_module._split_by_parameter(all_data, param_codes, params, order)
+    pdt.assert_frame_equal(res["a"], all_data.iloc[[3, 0, 2]])
+    pdt.assert_frame_equal(res["b"], all_data.iloc[[1]])
+
+
 # construct_model_names
 # ======================
 
@@ -253,26 +285,49 @@ def test_calculate_x_bounds_with_padding():
     pdt.assert_series_equal(expected_x_max, res_x_max)
 
 
-# replace_by_midpoint
+# calculate_bin_index
 # ====================
 
 
-def test_replace_by_midpoint_without_nan():
-    ind = ["model1", "model2", "corner_right", "corner_left"]
-    values = pd.Series([0.1, 0.2, 0.6, 0.15], index=ind)
-    group_bins = pd.Series([0.0, 0.15, 0.3, 0.45, 0.6, 0.75], name="group1")
-    res = test_module._replace_by_bin_midpoint(values, group_bins)
-    expected = pd.Series([0.075, 0.225, 0.525, 0.075], index=ind)
-    pdt.assert_series_equal(res, expected)
+def test_calculate_bin_index_without_nan():
+    values = pd.Series([0.1, 0.2, 0.6, 0.15])
+    res = test_module._calculate_bin_index(values, x_min=0.0, width=0.15, num_bins=5)
+    expected = np.array([0, 1, 3, 0])
+    np.testing.assert_array_equal(res, expected)
 
 
-def test_replace_by_midpoint_with_nan():
-    ind = ["model1", "missing", "corner_right", "corner_left"]
-    values = pd.Series([0.1, np.nan, 0.6, 0.15], index=ind)
-    group_bins = pd.Series([0.0, 0.15, 0.3, 0.45, 0.6, 0.75], name="group1")
-    res = test_module._replace_by_bin_midpoint(values, group_bins)
-    expected = pd.Series([0.075, 0.075, 0.525, 0.075], index=ind)
-    pdt.assert_series_equal(res, expected)
+def test_calculate_bin_index_with_nan():
+    values = pd.Series([0.1, np.nan, 0.6, 0.15])
+    res = test_module._calculate_bin_index(values, x_min=0.0, width=0.15, num_bins=5)
+    expected = np.array([0, -1, 3, 0])
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_calculate_bin_index_on_bin_edges():
+    values = pd.Series([0.0, 0.5, 1.0])
+    res = test_module._calculate_bin_index(values, x_min=0.0, width=0.25, num_bins=4)
+    expected = np.array([0, 1, 3])
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_calculate_bin_index_with_bins_per_value():
+    values = pd.Series([0.1, 0.1, 4.0])
+    x_min = np.array([0.0, 0.05, 0.0])
+    width = np.array([0.15, 0.15, 1.0])
+    res = test_module._calculate_bin_index(values, x_min, width, num_bins=5)
+    expected = np.array([0, 0, 3])
+    np.testing.assert_array_equal(res, expected)
+
+
+# calculate_bin_midpoints
+# ========================
+
+
+def test_calculate_bin_midpoints():
+    bin_index = np.array([0, 1, -1, 3])
+    res = test_module._calculate_bin_midpoints(bin_index, x_min=0.0, width=0.15)
+    expected = np.array([0.075, 0.225, 0.075, 0.525])
+    np.testing.assert_array_almost_equal(res, expected)
 
 
 # calculate dodge
@@ -280,21 +335,25 @@ def test_replace_by_midpoint_with_nan():
 
 
 def test_calculate_dodge_without_nan():
-    ind = ["small1", "small2", "middle1", "large1", "large2", "large3"]
-    values = pd.Series([0.05, 0.1, 0.2, 0.61, 0.62, 0.7], index=ind)
-    group_bins = pd.Series([0.0, 0.15, 0.3, 0.45, 0.6, 0.75], name="group1")
-    expected = pd.Series([0.5, 1.5, 0.5, 0.5, 1.5, 2.5], index=ind)
-    res = test_module._calculate_dodge(values, group_bins)
-    pdt.assert_series_equal(res, expected)
+    bin_index = np.array([0, 0, 1, 4, 4, 4])
+    expected = np.array([0.5, 1.5, 0.5, 0.5, 1.5, 2.5])
+    res = test_module._calculate_dodge(bin_index)
+    np.testing.assert_array_equal(res, expected)
 
 
 def test_calculate_dodge_with_nan():
-    ind = ["small1", "small2", "middle1", "large1", "nan0", "nan1"]
-    values_with_nan = pd.Series([0.05, 0.1, 0.2, 0.61, np.nan, np.nan], index=ind)
-    group_bins = pd.Series([0.0, 0.15, 0.3, 0.45, 0.6, 0.75], name="group1")
-    expected = pd.Series([0.5, 1.5, 0.5, 0.5, 0.5, 1.5], index=ind)
-    res = test_module._calculate_dodge(values_with_nan, group_bins)
-    pdt.assert_series_equal(res, expected)
+    bin_index = np.array([0, 0, 1, 4, -1, -1])
+    expected = np.array([0.5, 1.5, 0.5, 0.5, 0.5, 1.5])
+    res = test_module._calculate_dodge(bin_index)
+    np.testing.assert_array_equal(res, expected)
+
+
+def test_calculate_dodge_with_several_keys():
+    param_codes = np.array([1, 0, 1, 0, 1, 1])
+    bin_index = np.array([2, 2, 2, 2, 0, 2])
+    expected = np.array([0.5, 0.5, 1.5, 1.5, 0.5, 2.5])
+    res = test_module._calculate_dodge(param_codes, bin_index)
+    np.testing.assert_array_equal(res, expected)
 
 
 # create_plot_info
@@ -18,6 +18,7 @@ from bokeh.layouts import gridplot
 from bokeh.models import BoxSelectTool
 from bokeh.models import ColumnDataSource
 from bokeh.models import HoverTool
+from bokeh.models import Range1d
 from bokeh.models import TapTool
 from bokeh.models import Title
 from bokeh.models.callbacks import CustomJS
@@ -100,7 +101,7 @@ def _create_comparison_plot_components(
         group_info = plot_info["group_info"][group]
         title_fig = figure(
             title=Title(
-                text="Comparison Plot of " + group.title() + " Parameters",
+                text=f"Comparison Plot of {group.title()} Parameters",
                 align="center",
                 text_font_size="15pt",
             ),
@@ -112,15 +113,18 @@ def _create_comparison_plot_components(
 
         figure_dict[group]["__title__"] = title_fig
 
+        # one x range object per group instead of one per parameter plot.
+        x_range = Range1d(*group_info["x_range"])
+
         for i, (param, df) in enumerate(param_to_df.items()):
-            param_src = ColumnDataSource(df.reset_index())
+            param_src = ColumnDataSource(_narrow_glyph_columns(df).reset_index())
             param_plot = figure(
-                title=df["name"].unique()[0],
+                title=df["name"].iloc[0],
                 plot_height=plot_info["plot_height"],
                 plot_width=width,
                 tools="reset,save",
                 y_axis_location="left",
-                x_range=group_info["x_range"],
+                x_range=x_range,
                 y_range=plot_info["y_range"],
             )
 
@@ -167,13 +171,25 @@ def _create_comparison_plot_components(
     return source_dict, figure_dict, glyph_dict
 
 
+def _narrow_glyph_columns(df):
+    """Store the dodge as float32.
+
+    The dodge only holds small integer stack positions, so single precision is exact and
+    halves that column in the data that is sent to the browser. binned_x stays float64
+    because it is an absolute x coordinate that has to line up with the x range, the
+    rectangle width and the confidence intervals.
+
+    """
+    return df.astype({"dodge": "float32"})
+
+
 def _add_hover_tool(plot, point_glyph, df):
     top_cols = ["model", "name", "value"]
     optional_cols = ["model_class", "conf_int_lower", "conf_int_upper"]
     for col in optional_cols:
         if len(df[col].unique()) > 1:
             top_cols.append(col)
-    tooltips = [(col, "@" + col) for col in top_cols]
+    tooltips = [(col, f"@{col}") for col in top_cols]
     hover = HoverTool(renderers=[point_glyph], tooltips=tooltips)
     plot.tools.append(hover)
 
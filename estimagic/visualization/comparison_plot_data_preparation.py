@@ -37,27 +37,47 @@ def comparison_plot_inputs(results, x_padding, num_bins, color_dict, fig_height)
     )
 
     x_min, x_max = _calculate_x_bounds(all_data, x_padding)
-    bins, rect_width = _calculate_bins_and_rectangle_width(x_min, x_max, num_bins)
+    rect_width = _calculate_rectangle_width(x_min, x_max, num_bins)
+
+    x_min_per_row = all_data["group"].map(x_min).to_numpy()
+    width_per_row = all_data["group"].map(rect_width).to_numpy()
+    bin_index = _calculate_bin_index(
+        values=all_data["value"],
+        x_min=x_min_per_row,
+        width=width_per_row,
+        num_bins=num_bins,
+    )
+    all_data["binned_x"] = _calculate_bin_midpoints(
+        bin_index, x_min_per_row, width_per_row
+    )
+
+    # Only the row positions are sorted by model class and value. The data itself is
+    # reordered once, when it is split into parameters.
+    model_class_codes, _ = pd.factorize(all_data["model_class"], sort=True)
+    order = np.lexsort([all_data["value"].to_numpy(), model_class_codes])
+    param_codes, params = pd.factorize(all_data.index)
+    dodge = np.empty(len(order))
+    dodge[order] = _calculate_dodge(param_codes[order], bin_index[order])
+    all_data["dodge"] = np.where(bin_index == -1, -10, dodge)
 
     parameter_groups = parameter_groups[parameter_groups.notnull()]
     groups = parameter_groups.unique()
     source_dfs = {group: {} for group in groups}
+    # put the model first once for all parameters such that each parameter frame only
+    # needs the row selection and a fresh index.
+    all_data = all_data.reindex(columns=["model", *all_data.columns.drop("model")])
+    param_to_data = _split_by_parameter(all_data, param_codes, params, order)
     y_max = 5
     for param in parameter_groups.index:
         group = parameter_groups[param]
-        sdf = all_data.loc[param].copy(deep=True)
-        sdf.sort_values(["model_class", "value"], inplace=True)
-        sdf.set_index("model", drop=True, inplace=True)
-        sdf["binned_x"] = _replace_by_bin_midpoint(sdf["value"], bins.loc[group])
-        sdf["dodge"] = _calculate_dodge(sdf["value"], bins.loc[group])
-        sdf["dodge"] = sdf["dodge"].where(sdf["value"].notnull(), -10)
-        source_dfs[group][param] = sdf.reset_index()
+        sdf = param_to_data[param].reset_index(drop=True)
+        source_dfs[group][param] = sdf
         y_max = int(max(y_max, sdf["dodge"].max() + 1))
 
     plot_height = _determine_plot_height(
         figure_height=fig_height,
         y_max=y_max,
-        n_params=len(all_data.index.unique()),
+        n_params=len(param_to_data),
         n_groups=len(groups),
     )
 
@@ -142,6 +162,39 @@ def _combine_params_data(results, parameter_groups, parameter_names, color_dict)
     return all_data
 
 
+def _split_by_parameter(all_data, param_codes, params, order=None):
+    """Split the long format params data into one DataFrame per parameter.
+
+    This reuses the factorization of the parameter index that is also used to
+    calculate the dodge instead of hashing the index again.
+
+    Args:
+        all_data (pd.DataFrame): see _combine_params_data
+        param_codes (np.ndarray): Integer codes of the index of all_data as returned
+            by ``pd.factorize``.
+        params (pd.Index): The unique index entries that correspond to the codes.
+        order (np.ndarray, optional): Row positions in the order in which the rows
+            should appear within each parameter. Default is the order of all_data.
+
+    Returns:
+        param_to_data (dict): Map from parameter index entries to the rows of
+            all_data that belong to that parameter.
+
+    """
+    order = np.arange(len(all_data)) if order is None else order
+    rows = order[np.argsort(param_codes[order], kind="stable")]
+    sorted_codes = param_codes[rows]
+    starts = np.flatnonzero(np.diff(sorted_codes)) + 1
+    param_to_data = {
+        params[codes[0]]: all_data.iloc[positions]
+        for positions, codes in zip(
+            np.split(rows, starts), np.split(sorted_codes, starts)
+        )
+        if codes[0] != -1
+    }
+    return param_to_data
+
+
 def _construct_model_names(results):
     has_model_name = ["model_name" in res.info.keys() for res in results]
     if all(has_model_name):
@@ -196,12 +249,14 @@ def _calculate_x_bounds(params_data, padding):
         x_max (Series): Same as x_min but for right bound
 
     """
-    raw_min = (
-        params_data.groupby("group")[["conf_int_lower", "value"]].min().min(axis=1)
-    )
-    raw_max = (
-        params_data.groupby("group")[["conf_int_upper", "value"]].max().max(axis=1)
+    stats = params_data.groupby("group").agg(
+        conf_int_lower=("conf_int_lower", "min"),
+        value_min=("value", "min"),
+        value_max=("value", "max"),
+        conf_int_upper=("conf_int_upper", "max"),
     )
+    raw_min = stats[["conf_int_lower", "value_min"]].min(axis=1)
+    raw_max = stats[["conf_int_upper", "value_max"]].max(axis=1)
     white_space = (raw_max - raw_min).clip(1e-50) * padding
     x_min = raw_min - white_space
     x_max = raw_max + white_space
@@ -210,26 +265,78 @@ def _calculate_x_bounds(params_data, padding):
     return x_min, x_max
 
 
-def _calculate_bins_and_rectangle_width(x_min, x_max, num_bins):
-    bins_transposed, stepsize = np.linspace(
-        start=x_min, stop=x_max, num=num_bins + 1, retstep=True
-    )
-    bins = pd.DataFrame(data=bins_transposed.T, index=x_min.index)
-    rectangle_width = pd.Series(data=stepsize, index=x_min.index, name="width")
-    return bins, rectangle_width
+def _calculate_rectangle_width(x_min, x_max, num_bins):
+    rectangle_width = (x_max - x_min) / num_bins
+    rectangle_width.name = "width"
+    return rectangle_width
+
+
+def _calculate_bin_index(values, x_min, width, num_bins):
+    """Calculate the index of the bin each value falls into.
 
+    The bins have equal width, so the bin index is found by rescaling the values
+    instead of going through ``pd.cut``. As in ``pd.cut`` the bins are closed on the
+    right. Values on the left edge get the first bin.
 
-def _replace_by_bin_midpoint(values, bins):
-    midpoints = (bins + bins.shift(periods=-1))[:-1] / 2
-    sr = pd.cut(values, bins, labels=midpoints).astype(float)
-    sr.fillna(midpoints[0], inplace=True)
-    return sr
+    x_min and width can be arrays of the same length as values. This allows to bin
+    the values of all parameter groups in one vectorized pass.
 
+    Args:
+        values (pd.Series): Values to be binned.
+        x_min (float or np.ndarray): Left edge of the first bin.
+        width (float or np.ndarray): Width of the bins.
+        num_bins (int): Number of bins.
+
+    Returns:
+        np.ndarray: Integer bin indices. Missing values get -1.
+
+    """
+    vals = values.to_numpy(dtype=float)
+
+    # work in place on one buffer to avoid a temporary array per operation
+    rescaled = vals - x_min
+    rescaled /= width
+    np.ceil(rescaled, out=rescaled)
+    rescaled -= 1
+    # fmax and fmin clamp to the valid bins and replace NaNs without branching
+    np.fmax(rescaled, 0, out=rescaled)
+    np.fmin(rescaled, num_bins - 1, out=rescaled)
+    idx = rescaled.astype(int)
+    # correct for rounding errors at the bin edges, computed as in np.linspace
+    idx -= (idx > 0) & (vals <= idx * width + x_min)
+    idx += (idx < num_bins - 1) & (vals > (idx + 1) * width + x_min)
+
+    return np.where(np.isnan(vals), -1, idx)
+
+
+def _calculate_bin_midpoints(bin_index, x_min, width):
+    """Calculate the midpoints of bins. Missing values are put into the first bin."""
+    return x_min + (np.maximum(bin_index, 0) + 0.5) * width
 
-def _calculate_dodge(values, bins):
-    df = values.to_frame()
-    df["bin"] = pd.cut(values, bins, labels=range(len(bins) - 1))
-    dodge = 0.5 + df.groupby("bin").cumcount()
+
+def _calculate_dodge(*keys):
+    """Stack entries with the same keys on top of each other.
+
+    This is a vectorized version of ``0.5 + df.groupby(keys).cumcount()`` that
+    numbers the rows within each combination of keys in order of appearance.
+
+    Args:
+        keys (np.ndarray): Integer arrays of equal length.
+
+    Returns:
+        np.ndarray: The y position of each entry.
+
+    """
+    n_obs = len(keys[0])
+    order = np.lexsort(keys[::-1])
+    sorted_keys = np.column_stack(keys)[order]
+    is_start = np.ones(n_obs, dtype=bool)
+    is_start[1:] = (sorted_keys[1:] != sorted_keys[:-1]).any(axis=1)
+    starts = np.flatnonzero(is_start)
+    run_lengths = np.diff(np.append(starts, n_obs))
+
+    dodge = np.empty(n_obs)
+    dodge[order] = 0.5 + np.arange(n_obs) - np.repeat(starts, run_lengths)
     return dodge
 
 
@@ -252,9 +359,7 @@ def _create_plot_info(x_min, x_max, rect_width, y_max, plot_height):
                 group: {x_range: x_range, width: rect_width}
     """
     group_plot_info = pd.concat([x_min, x_max, rect_width], axis=1)
-    group_plot_info["x_range"] = group_plot_info.apply(
-        lambda x: (x["x_min"], x["x_max"]), axis=1
-    )
+    group_plot_info["x_range"] = list(zip(x_min, x_max))
     group_plot_info.drop(columns=["x_min", "x_max"], inplace=True)
     group_plot_info = group_plot_info.T.to_dict()
     plot_info = {
@@ -379,17 +379,13 @@ def _convert_model_to_series(
         sig_bins = [-1] + sorted(sig_levels) + [2]
         value_sr = round(df["value"], sig_digits).replace(np.nan, "").astype("str")
         value_sr += "$^{"
-        value_sr += (
-            pd.cut(
-                df["pvalue"],
-                bins=sig_bins,
-                labels=[
-                    "*" * (len(sig_levels) - i) for i in range(len(sig_levels) + 1)
-                ],
-            )
-            .astype("str")
-            .replace("nan", "")
+        star_labels = np.array(
+            ["*" * (len(sig_levels) - i) for i in range(len(sig_levels) + 1)] + [""],
+            dtype=object,
         )
+        # missing p-values have the code -1 and thus get the empty label at the end
+        star_codes = pd.cut(df["pvalue"], bins=sig_bins).cat.codes.to_numpy()
+        value_sr += star_labels[star_codes]
         value_sr += " }$"
     else:
         value_sr = round(df["value"], sig_digits).replace(np.nan, "").astype("str")